@@ -111,9 +111,16 @@ def asarray(
     out: array
         an array containing the data from ``obj``.
 
+    Raises
+    ------
+    ValueError
+        If ``copy=False`` and a copy would be necessary, a ``ValueError`` must be raised.
+
     Notes
     -----
 
+    -   If ``obj`` supports the buffer protocol and the function does not copy, the returned array shares memory with ``obj``. If the buffer exposed by ``obj`` is read-only (e.g., a ``bytes`` object), the behavior of in-place operations on the returned array is unspecified and thus implementation-defined (see :ref:`copyview-mutability`).
+    -   If ``obj`` is a nested sequence whose sequences at the same nesting level do not all have the same length (i.e., a ragged nested sequence), or whose scalars do not all reside at the same nesting level, behavior is unspecified and thus implementation-defined. Conforming implementations may raise an exception.
     -   If ``obj`` is a sequence with some elements being arrays, behavior is unspecified and thus implementation-defined. Conforming implementations may perform a conversion or raise an exception. To join a sequence of arrays along a new axis, see :func:`~array_api.stack`.
     -   If ``dtype`` is not ``None``, then array conversions should obey :ref:`type-promotion` rules. Conversions not specified according to :ref:`type-promotion` rules may or may not be permitted by a conforming array library. To perform an explicit cast, use :func:`array_api.astype`.
     -   If an input value exceeds the precision of the resolved output array data type, behavior is unspecified and thus implementation-defined.
@@ -479,6 +486,8 @@ def meshgrid(*arrays: array, indexing: Literal["xy", "ij"] = "xy") -> Tuple[arra
     Notes
     -----
 
+    -   Each returned array may be a view in which multiple elements refer to the same memory location (e.g., for strided array libraries, a broadcasted view of the corresponding input array). Accordingly, the behavior of in-place operations on the returned arrays is unspecified and thus implementation-defined (see :ref:`copyview-mutability`).
+
     .. versionchanged:: 2022.12
        Added complex data type support.
 
@@ -673,6 +673,8 @@ def fftshift(x: array, /, *, axes: Optional[Union[int, Sequence[int]]] = None) -
     Notes
     -----
 
+    -   For each axis ``i`` specified by ``axes``, the elements along axis ``i`` must be cyclically shifted by ``x.shape[i]//2`` positions toward larger indices. When the resolved axes are unique, this function must be equivalent to ``roll(x, tuple(x.shape[i]//2 for i in axes), axis=tuple(axes))`` (see :func:`~array_api.roll`), where ``axes`` is the tuple of axes over which to shift.
+
     .. versionadded:: 2022.12
     """
 
@@ -703,5 +705,7 @@ def ifftshift(
     Notes
     -----
 
+    -   For each axis ``i`` specified by ``axes``, the elements along axis ``i`` must be cyclically shifted by ``x.shape[i]//2`` positions toward smaller indices. When the resolved axes are unique, this function must be equivalent to ``roll(x, tuple(-(x.shape[i]//2) for i in axes), axis=tuple(axes))`` (see :func:`~array_api.roll`), where ``axes`` is the tuple of axes over which to shift.
+
     .. versionadded:: 2022.12
     """
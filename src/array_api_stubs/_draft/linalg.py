@@ -445,9 +445,9 @@ def matrix_norm(
 
         If ``ord=1``, the norm corresponds to the induced matrix norm where ``p=1`` (i.e., the maximum absolute value column sum).
 
-        If ``ord=2``, the norm corresponds to the induced matrix norm where ``p=inf`` (i.e., the maximum absolute value row sum).
+        If ``ord=2``, the norm corresponds to the induced matrix norm where ``p=2`` (i.e., the largest singular value).
 
-        If ``ord=inf``, the norm corresponds to the induced matrix norm where ``p=2`` (i.e., the largest singular value).
+        If ``ord=inf``, the norm corresponds to the induced matrix norm where ``p=inf`` (i.e., the maximum absolute value row sum).
 
         Default: ``'fro'``.
 
@@ -459,6 +459,9 @@ def matrix_norm(
     Notes
     -----
 
+    -   For ``ord`` equal to ``2``, ``-2``, or ``'nuc'``, the norm is a function of the singular values of each matrix only, and conforming implementations need not compute singular vectors (see :func:`~array_api.linalg.svdvals`).
+    -   When ``ord`` is ``'fro'``, conforming implementations should avoid intermediate overflow and underflow (e.g., by scaling the accumulated sum of squares) such that a finite, nonzero norm that is representable in the output data type is not computed as ``+infinity`` or ``0``.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
     """
@@ -950,6 +953,8 @@ def vector_norm(
     Notes
     -----
 
+    -   When ``ord`` is ``2`` (or any other finite value whose computation involves raising absolute values to a power), conforming implementations should avoid intermediate overflow and underflow (e.g., by scaling the accumulated sum of powers) such that a finite, nonzero norm that is representable in the output data type is not computed as ``+infinity`` or ``0``.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
     """
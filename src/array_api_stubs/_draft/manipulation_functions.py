@@ -37,6 +37,8 @@ def broadcast_arrays(*arrays: array) -> Tuple[array, ...]:
     Notes
     -----
 
+    -   Each returned array **may** be a view of its corresponding input array in which multiple elements refer to the same memory location (see :func:`~array_api.broadcast_to`). Accordingly, the behavior of in-place operations on the returned arrays is unspecified and thus implementation-defined (see :ref:`copyview-mutability`).
+
     .. versionchanged:: 2025.12
        Changed the return value from a List to a Tuple.
     """
@@ -85,6 +87,11 @@ def broadcast_to(x: array, /, shape: Tuple[int, ...]) -> array:
     out: array
         an array having the specified shape. **Must** have the same data type as ``x``.
 
+    Notes
+    -----
+
+    -   The returned array **may** be a view of ``x`` in which multiple elements refer to the same memory location (e.g., for strided array libraries, a broadcasted axis having a stride of zero). Accordingly, the behavior of in-place operations on the returned array is unspecified and thus implementation-defined (see :ref:`copyview-mutability`).
+
     .. versionchanged:: 2024.12
        Clarified broadcast behavior.
     """
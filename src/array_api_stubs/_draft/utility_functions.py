@@ -114,7 +114,8 @@ def diff(
     Notes
     -----
 
-    -   The first-order differences are given by ``out[i] = x[i+1] - x[i]`` along a specified axis. Higher-order differences **must** be calculated recursively (e.g., by calling ``diff(out, axis=axis, n=n-1)``).
+    -   The first-order differences are given by ``out[i] = x[i+1] - x[i]`` along a specified axis. Higher-order differences **must** be mathematically equivalent to recursively computing first-order differences (e.g., by calling ``diff(out, axis=axis, n=n-1)``); however, conforming implementations **may** compute higher-order differences using alternative algorithms (e.g., by directly applying binomial coefficients to ``n+1`` consecutive elements).
+    -   If ``prepend`` and/or ``append`` are provided, their values **must** be joined with ``x`` along the axis specified by ``axis`` once, prior to computing differences, and **must not** be joined again when computing higher-order differences.
     -   If a conforming implementation chooses to support ``prepend`` and ``append`` arrays which have a different data type than ``x``, behavior is unspecified and thus implementation-defined. Implementations **may** choose to type promote (:ref:`type-promotion`), cast ``prepend`` and/or ``append`` to the same data type as ``x``, or raise an exception.
 
     .. versionadded:: 2024.12